@@ -0,0 +1,16 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+
+@register()
+def check_persistent_connections(app_configs, **kwargs):
+    if settings.DATABASES['default'].get('CONN_MAX_AGE', 0):
+        return []
+    return [
+        Warning(
+            'The default database does not use persistent connections.',
+            hint="Set CONN_MAX_AGE on DATABASES['default'] so requests reuse "
+                 "their database connection instead of opening a new one.",
+            id='myapp.W001',
+        )
+    ]
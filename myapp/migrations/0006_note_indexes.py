@@ -0,0 +1,21 @@
+# Generated by Django 4.1.13 on 2026-10-15 22:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0005_note_font_size_note_font_style'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', '-pinned'], name='myapp_note_user_id_747aab_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'category'], name='myapp_note_user_id_0795e3_idx'),
+        ),
+    ]
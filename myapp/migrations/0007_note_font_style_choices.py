@@ -0,0 +1,42 @@
+# Generated by Django 4.1.13 on 2026-10-15 22:40
+
+from django.db import migrations, models
+
+FONT_STYLES = [(0, 'normal'), (1, 'italic'), (2, 'bold'), (3, 'underline')]
+
+
+def font_style_to_code(apps, schema_editor):
+    Note = apps.get_model('myapp', 'Note')
+    for value, name in FONT_STYLES:
+        Note.objects.filter(font_style=name).update(font_style_code=value)
+
+
+def font_style_to_name(apps, schema_editor):
+    Note = apps.get_model('myapp', 'Note')
+    for value, name in FONT_STYLES:
+        Note.objects.filter(font_style_code=value).update(font_style=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0006_note_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='note',
+            name='font_style_code',
+            field=models.PositiveSmallIntegerField(choices=FONT_STYLES, default=0),
+        ),
+        migrations.RunPython(font_style_to_code, font_style_to_name),
+        migrations.RemoveField(
+            model_name='note',
+            name='font_style',
+        ),
+        migrations.RenameField(
+            model_name='note',
+            old_name='font_style_code',
+            new_name='font_style',
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.1.13 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0009_related_names'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(condition=models.Q(('pinned', True)), fields=['user', '-id'], name='note_user_pinned_idx'),
+        ),
+    ]
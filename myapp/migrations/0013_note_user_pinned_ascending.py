@@ -0,0 +1,21 @@
+# Generated by Django 4.1.13 on 2026-10-15 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0012_note_updated_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='note',
+            name='myapp_note_user_id_747aab_idx',
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'pinned'], name='myapp_note_user_id_1d9f44_idx'),
+        ),
+    ]
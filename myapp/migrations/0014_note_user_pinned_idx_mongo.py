@@ -0,0 +1,48 @@
+# Generated by Django 4.1.13 on 2026-10-15 23:50
+
+from django.db import migrations, models
+
+INDEX_NAME = 'note_user_pinned_idx'
+
+
+def pinned_index():
+    return models.Index(fields=['user', '-id'], condition=models.Q(pinned=True), name=INDEX_NAME)
+
+
+def create_pinned_index(apps, schema_editor):
+    # djongo drops an index's condition and mangles '-id' into a key on a
+    # missing field, so build the partial index with pymongo there instead.
+    Note = apps.get_model('myapp', 'Note')
+    if schema_editor.connection.vendor == 'djongo':
+        schema_editor.connection.ensure_connection()
+        schema_editor.connection.connection[Note._meta.db_table].create_index(
+            [('user_id', 1), ('id', -1)],
+            name=INDEX_NAME,
+            partialFilterExpression={'pinned': True},
+        )
+    else:
+        schema_editor.add_index(Note, pinned_index())
+
+
+def drop_pinned_index(apps, schema_editor):
+    Note = apps.get_model('myapp', 'Note')
+    if schema_editor.connection.vendor == 'djongo':
+        schema_editor.connection.ensure_connection()
+        schema_editor.connection.connection[Note._meta.db_table].drop_index(INDEX_NAME)
+    else:
+        schema_editor.remove_index(Note, pinned_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0013_note_user_pinned_ascending'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='note',
+            name=INDEX_NAME,
+        ),
+        migrations.RunPython(create_pinned_index, drop_pinned_index),
+    ]
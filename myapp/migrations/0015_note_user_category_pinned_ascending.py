@@ -0,0 +1,21 @@
+# Generated by Django 4.1.13 on 2026-10-15 23:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('myapp', '0014_note_user_pinned_idx_mongo'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='note',
+            name='myapp_note_user_id_46a3a6_idx',
+        ),
+        migrations.AddIndex(
+            model_name='note',
+            index=models.Index(fields=['user', 'category', 'pinned'], name='myapp_note_user_id_ed1054_idx'),
+        ),
+    ]
@@ -1,23 +1,54 @@
 from django.db import models
 from django.contrib.auth.models import User
 
+class FontStyle(models.IntegerChoices):
+    NORMAL = 0, 'normal'
+    ITALIC = 1, 'italic'
+    BOLD = 2, 'bold'
+    UNDERLINE = 3, 'underline'
+
 
 class Category(models.Model):
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=120, db_index=True)
     user = models.ForeignKey(User, on_delete=models.CASCADE)
 
+    class Meta:
+        default_related_name = 'categories'
+
     def __str__(self):
         return self.title
 
+class NoteQuerySet(models.QuerySet):
+    def bulk_create(self, objs, batch_size=1000, **kwargs):
+        return super().bulk_create(objs, batch_size=batch_size, **kwargs)
+
+
+class NoteTitleManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().only('id', 'title', 'user')
+
+
 class Note(models.Model):
-    title = models.CharField(max_length=255)
+    title = models.CharField(max_length=120, db_index=True)
     content = models.TextField()
     category = models.ForeignKey(Category, on_delete=models.CASCADE, null=True, blank=True)
-    user = models.ForeignKey(User, on_delete=models.CASCADE,default=0)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
     pinned = models.BooleanField(default=False)
     font_size = models.IntegerField(default=16)
-    font_style = models.CharField(max_length=255, default='normal')
-    
+    font_style = models.PositiveSmallIntegerField(default=FontStyle.NORMAL, choices=FontStyle.choices)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = NoteQuerySet.as_manager()
+    titles = NoteTitleManager()
+
+    class Meta:
+        default_related_name = 'notes'
+        indexes = [
+            models.Index(fields=['user', 'pinned']),
+            models.Index(fields=['user', 'category', 'pinned']),
+            # The partial index over pinned notes (user, -id WHERE pinned) is
+            # created by migration 0014, since djongo cannot express it.
+        ]
 
     def __str__(self):
         return self.title
\ No newline at end of file
@@ -1,30 +1,179 @@
 # serializers.py
 
+from copy import copy
+from operator import attrgetter
+from django.utils.functional import cached_property
 from rest_framework import serializers
+from rest_framework.utils.serializer_helpers import BindingDict
 from django.contrib.auth.models import User
-from .models import Category, Note
+from .models import Category, FontStyle, Note
 
 
-class UserSerializer(serializers.ModelSerializer):
+class CachedFieldsMixin:
+    """
+    Builds the serializer fields once per class and hands every instance
+    shallow copies, instead of rebuilding them on each instantiation. The
+    names of the readable fields are likewise worked out once per class.
+    """
+    _fields_cache = {}
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in self._fields_cache:
+            self._fields_cache[cls] = super().get_fields()
+        return {name: copy(field) for name, field in self._fields_cache[cls].items()}
+
+    @property
+    def _readable_fields(self):
+        cls = type(self)
+        names = cls.__dict__.get('_readable_field_names')
+        if names is None:
+            names = [name for name, field in self.fields.items() if not field.write_only]
+            cls._readable_field_names = names
+        fields = self.fields
+        return [fields[name] for name in names]
+
+
+# (serializer class, field name) -> (label, source, source_attrs)
+_BIND_CACHE = {}
+
+
+class CachedBindMixin:
+    """
+    Remembers what each field resolved its label and source to on first bind,
+    so later instances of the same serializer class skip recomputing them.
+    Fields that override `bind()` are always bound normally.
+    """
+
+    @cached_property
+    def fields(self):
+        fields = BindingDict(self)
+        for field_name, field in self.get_fields().items():
+            key = (type(self), field_name)
+            cached = _BIND_CACHE.get(key)
+            if type(field).bind is not serializers.Field.bind:
+                fields[field_name] = field
+            elif cached is None:
+                fields[field_name] = field
+                _BIND_CACHE[key] = (field.label, field.source, field.source_attrs)
+            else:
+                field.field_name = field_name
+                field.parent = self
+                field.label, field.source, field.source_attrs = cached
+                fields.fields[field_name] = field
+        return fields
+
+
+class EagerLoadingMixin:
+    """
+    Lets a serializer name the relations it dereferences, so views can load
+    them with the queryset instead of one query per row. Empty while the
+    serializers only read the raw `_id` columns.
+    """
+    SELECT_RELATED = ()
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        # select_related() with no arguments would follow every relation.
+        if cls.SELECT_RELATED:
+            queryset = queryset.select_related(*cls.SELECT_RELATED)
+        return queryset
+
+
+class ChoiceNameField(serializers.ChoiceField):
+    """
+    Reads and writes a choices column by its name, e.g. 'italic', instead of
+    the value actually stored.
+    """
+
+    def __init__(self, choices, **kwargs):
+        self.values_by_name = {name: value for value, name in choices}
+        self.names_by_value = dict(choices)
+        super().__init__(choices=list(self.values_by_name), **kwargs)
+
+    def to_internal_value(self, data):
+        return self.values_by_name[super().to_internal_value(data)]
+
+    def to_representation(self, value):
+        return self.names_by_value.get(value, value)
+
+
+def compile_representation(field_names):
+    """
+    Builds a `to_representation` that reads `field_names` straight off the
+    instance, for serializers whose output is a fixed set of plain attributes.
+    """
+    getter = attrgetter(*field_names)
+    if len(field_names) == 1:
+        name = field_names[0]
+        return lambda self, instance: {name: getter(instance)}
+
+    def to_representation(self, instance):
+        return dict(zip(field_names, getter(instance)))
+    return to_representation
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
-        fields = ['id', 'username', 'email']
+        fields = ('id', 'username', 'email')
 
+    to_representation = compile_representation(Meta.fields)
+
+    @classmethod
+    def serialize_ids(cls, user_ids):
+        """Serialized users keyed by id, fetched in one query."""
+        users = User.objects.filter(id__in=set(user_ids)).values(*cls.Meta.fields)
+        return {user['id']: user for user in users}
+
+
+class CategorySerializer(EagerLoadingMixin, CachedBindMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    user = serializers.PrimaryKeyRelatedField(read_only=True, source='user_id')
 
-class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
-        fields = ['id', 'title', 'user']  
-        extra_kwargs = {
-            'user': {'read_only': True}  
-        }
+        fields = ('id', 'title', 'user')
+
 
+class NoteSerializer(EagerLoadingMixin, CachedBindMixin, CachedFieldsMixin, serializers.ModelSerializer):
+    # Output key -> model attribute. Relations read the raw `_id` column so
+    # serializing never dereferences the foreign key.
+    ATTRIBUTES = {
+        'id': 'id',
+        'title': 'title',
+        'content': 'content',
+        'category': 'category_id',
+        'user': 'user_id',
+        'pinned': 'pinned',
+        'font_size': 'font_size',
+        'font_style': 'font_style',
+    }
+
+    user = serializers.PrimaryKeyRelatedField(read_only=True, source='user_id')
+    font_style = ChoiceNameField(FontStyle.choices, required=False)
 
-class NoteSerializer(serializers.ModelSerializer):
     class Meta:
         model = Note
-        fields = ['id', 'title', 'content', 'category', 'user','pinned', 'font_size', 'font_style']
+        fields = ('id', 'title', 'content', 'category', 'user', 'pinned', 'font_size', 'font_style')
         extra_kwargs = {
-            'user':{'read_only':True},
             'pinned':{'default':False}
-        }
\ No newline at end of file
+        }
+
+    def to_representation(self, instance):
+        # Rows from `queryset.values(*Meta.fields)` already use the output keys.
+        if isinstance(instance, dict):
+            data = {field: instance[field] for field in self.Meta.fields}
+        else:
+            data = {field: getattr(instance, self.ATTRIBUTES[field]) for field in self.Meta.fields}
+        if 'font_style' in data:
+            data['font_style'] = self.fields['font_style'].to_representation(data['font_style'])
+        return data
+
+
+class NoteListSerializer(NoteSerializer):
+    """
+    Note listing without the `content` body. Pair it with
+    `Note.objects.defer('content')` so the text column is never loaded.
+    """
+    class Meta(NoteSerializer.Meta):
+        fields = tuple(f for f in NoteSerializer.Meta.fields if f != 'content')
\ No newline at end of file
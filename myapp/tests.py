@@ -1,42 +1,69 @@
 from rest_framework.test import APITestCase, APIClient
-from rest_framework import status
+from rest_framework import serializers, status
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from myapp.models import Category, Note
+from myapp.serializers import CachedBindMixin
 from rest_framework_simplejwt.tokens import RefreshToken
-from pymongo import MongoClient
+import json
+from unittest.mock import patch
+
+# JSON request bodies, encoded once for the whole module
+REGISTER_BODY = json.dumps({
+    "username": "newuser",
+    "email": "newuser@example.com",
+    "password": "newpassword123",
+    "first_name": "New",
+    "last_name": "User"
+}).encode()
+LOGIN_BODY = json.dumps({"username": "testuser", "password": "password123"}).encode()
+RESET_PASSWORD_BODY = json.dumps({"current_password": "password123", "new_password": "newpassword123"}).encode()
 
 class NoteAppTests(APITestCase):
-    @classmethod
-    def tearDownClass(cls):
-        """
-        Cleanup resources after all tests have run:
-        - Close MongoDB connections explicitly to prevent threading issues.
-        """
-        MongoClient().close()  # Explicitly close the MongoDB connection
-        super().tearDownClass()
+    """
+    API tests for the notevault endpoints.
 
-    def setUp(self):
+    Do not change to TransactionTestCase: all fixtures are rolled back via
+    savepoints, whereas TransactionTestCase truncates every table after each test.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
         """
-        Unit-level test setup:
+        Class-level test data, created once and rolled back after the class:
         - Creates a user for authentication and generates a JWT access token.
         - Creates a default category and note for testing category and note functionalities.
+        - Builds the URLs that address the default category and note.
         """
         # Create a test user
-        self.user = User.objects.create_user(username="testuser", email="test@example.com", password="password123")
+        cls.user = User.objects.create_user(username="testuser", email="test@example.com", password="password123")
 
         # Generate JWT access token for the test user
-        refresh = RefreshToken.for_user(self.user)
-        self.access_token = str(refresh.access_token)
-        
-        # Set up the authenticated client with the token
-        self.client = APIClient()
-        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        refresh = RefreshToken.for_user(cls.user)
+        cls.access_token = str(refresh.access_token)
 
         # Create a default category and note for testing
-        self.category = Category.objects.create(title="Default Category", user=self.user)
-        self.note = Note.objects.create(
-            title="Default Note", content="This is a default note.", category=self.category, user=self.user
-        )
+        cls.category = Category.objects.bulk_create([Category(title="Default Category", user=cls.user)])[0]
+        cls.note = Note.objects.bulk_create([
+            Note(title="Default Note", content="This is a default note.", category=cls.category, user=cls.user)
+        ])[0]
+
+        # URLs of the default category and note, built once
+        cls.note_url = f'/notes/{cls.note.id}/'
+        cls.note_update_url = f'/notes/update/{cls.note.id}/'
+        cls.note_delete_url = f'/notes/delete/{cls.note.id}/'
+        cls.cat_notes_url = f'/notes/category/{cls.category.id}/'
+        cls.cat_delete_url = f'/categories/delete/{cls.category.id}/'
+
+    def setUp(self):
+        """
+        Unit-level test setup:
+        - Authenticates the test client as the test user, bypassing JWT verification.
+        - Clears the cache so cached Gemini answers never leak between tests.
+        """
+        cache.clear()
+        # APITestCase has already created a fresh APIClient for this test
+        self.client.force_authenticate(user=self.user)
 
     # ------------------------- User Authentication Tests -------------------------
 
@@ -49,17 +76,8 @@ class NoteAppTests(APITestCase):
             2. Access and refresh tokens are returned in the response.
         - Ensures the API correctly handles user creation and token generation.
         """
-        # Payload with valid registration data
-        data = {
-            "username": "newuser",
-            "email": "newuser@example.com",
-            "password": "newpassword123",
-            "first_name": "New",
-            "last_name": "User"
-        }
-        
-        # Make a POST request to the /register/ endpoint
-        response = self.client.post('/register/', data)
+        # Make a POST request to the /register/ endpoint with valid registration data
+        response = self.client.post('/register/', REGISTER_BODY, content_type='application/json')
         
         # Assert that the response status is 201 Created
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
@@ -68,27 +86,6 @@ class NoteAppTests(APITestCase):
         self.assertIn("access", response.data)
         self.assertIn("refresh", response.data)
 
-    def test_unsuccessful_registration_missing_fields(self):
-        """
-        - Test Level: Unit-level test
-        - Purpose: Validate error handling for registration with missing required fields.
-        - Software: Tests the `/register/` endpoint to ensure:
-            1. Missing email and password result in a 400 Bad Request status.
-            2. The API provides appropriate error messages for each missing field.
-        - Ensures input validation for registration requests is implemented correctly.
-        """
-        # Payload with only the username, missing email and password
-        data = {"username": "newuser"}
-        
-        # Make a POST request to the /register/ endpoint
-        response = self.client.post('/register/', data)
-        
-        # Assert that the response status is 400 Bad Request
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Assert that the error message is present in the response
-        self.assertIn("error", response.data)
-
     def test_unsuccessful_registration_duplicate_username(self):
         """
         - Test Level: Unit-level.
@@ -120,7 +117,7 @@ class NoteAppTests(APITestCase):
         - Ensures the API handles successful authentication and token generation.
         """
         # Payload with valid login credentials
-        response = self.client.post('/login/', {"username": "testuser", "password": "password123"})
+        response = self.client.post('/login/', LOGIN_BODY, content_type='application/json')
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -146,24 +143,6 @@ class NoteAppTests(APITestCase):
         # Assert that the error message is present in the response
         self.assertIn("detail", response.data)
 
-    def test_unsuccessful_login_missing_fields(self):
-        """
-        - Test Level: Unit-level test
-        - Purpose: Validate error handling for login with missing required fields.
-        - Software: Tests the `/login/` endpoint to ensure:
-            1. Missing password results in a 400 Bad Request status.
-            2. The API provides a clear error message indicating the missing field.
-        - Ensures input validation for login requests is implemented correctly.
-        """
-        # Payload missing the password field
-        response = self.client.post('/login/', {"username": "testuser"})
-        
-        # Assert that the response status is 400 Bad Request
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Assert that the error message is present in the response
-        self.assertIn("password", response.data)
-
     # ------------------------- Password Reset Tests -------------------------
 
     def test_reset_password_success(self):
@@ -175,11 +154,8 @@ class NoteAppTests(APITestCase):
             2. User's password is updated successfully.
         - Ensures that password reset operations work as expected.
         """
-        # Payload with correct current password and a new password
-        data = {"current_password": "password123", "new_password": "newpassword123"}
-        
-        # Make a POST request to the /reset-password/ endpoint
-        response = self.client.post('/reset-password/', data)
+        # Make a POST request to the /reset-password/ endpoint with the correct current password and a new password
+        response = self.client.post('/reset-password/', RESET_PASSWORD_BODY, content_type='application/json')
         
         # Assert that the response status is 200 OK indicating successful reset
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -212,27 +188,6 @@ class NoteAppTests(APITestCase):
         self.user.refresh_from_db()
         self.assertTrue(self.user.check_password("password123"))  # Original password remains unchanged
 
-    def test_unsuccessful_reset_password_missing_fields(self):
-        """
-        - Test Level: Unit-level test.
-        - Purpose: Validate error handling for password reset with missing required fields.
-        - Software: Tests the /reset-password/ endpoint to ensure:
-            1. Missing new password results in a 400 Bad Request status.
-            2. The API provides a clear error message indicating the missing field.
-        - Ensures input validation for password reset requests is implemented correctly.
-        """
-        # Payload missing the new password field
-        data = {"current_password": "password123"}  # Missing new password
-        
-        # Make a POST request to the /reset-password/ endpoint
-        response = self.client.post('/reset-password/', data)
-        
-        # Assert that the response status is 400 Bad Request indicating validation error
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Assert that the response contains a clear error message about the missing field
-        self.assertIn("error", response.data)
-
     # ------------------------- Profile Management Tests -------------------------
 
     def test_view_profile_success(self):
@@ -253,6 +208,22 @@ class NoteAppTests(APITestCase):
         # Assert that the username in the response matches the authenticated user
         self.assertEqual(response.data["username"], "testuser")
 
+    def test_view_profile_with_jwt(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that protected routes accept a JWT access token.
+        - Software: Tests the `/profile/` endpoint to ensure:
+            1. A request carrying a valid Bearer token is authenticated.
+            2. The profile of the token's user is returned.
+        - Ensures JWT authentication works end to end for protected endpoints.
+        """
+        # Use a client that authenticates only through the JWT access token
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.access_token}")
+        response = client.get('/profile/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["username"], "testuser")
+
     def test_update_profile_success(self):
         """
         - Test Level: Unit-level.
@@ -310,16 +281,17 @@ class NoteAppTests(APITestCase):
         - Ensures cascading delete functionality works correctly.
         """
         # Make a DELETE request to remove the category
-        response = self.client.delete(f'/categories/delete/{self.category.id}/')
+        response = self.client.delete(self.cat_delete_url)
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         
-        # Assert that the category no longer exists in the database
-        self.assertFalse(Category.objects.filter(id=self.category.id).exists())
-        
-        # Assert that notes associated with the category are also deleted
-        self.assertFalse(Note.objects.filter(category=self.category).exists())
+        # Assert that neither the category nor its notes remain, in a single query
+        remaining = Category.objects.filter(id=self.category.id).values('id').union(
+            Note.objects.filter(category_id=self.category.id).values('id'), all=True
+        )
+        with self.assertNumQueries(1):
+            self.assertFalse(remaining.exists())
 
     def test_get_categories_success(self):
         """
@@ -330,8 +302,9 @@ class NoteAppTests(APITestCase):
             2. Authentication is required to access the endpoint.
         - Ensures users can view their own categories securely.
         """
-        # Make a GET request to the `/categories/` endpoint
-        response = self.client.get('/categories/')
+        # Make a GET request to the `/categories/` endpoint, which must take a single query
+        with self.assertNumQueries(1):
+            response = self.client.get('/categories/')
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -339,26 +312,16 @@ class NoteAppTests(APITestCase):
         # Assert that the number of categories returned matches the database
         self.assertEqual(len(response.data), 1)  # One category was created in `setUp`
 
-    def test_unsuccessful_create_category_missing_title(self):
-        """
-        - Test Level: Unit-level.
-        - Purpose: Validate error handling for category creation when the required 'title' field is missing.
-        - Software: Tests the `/categories/create/` endpoint to ensure:
-            1. The API returns a 400 Bad Request status when required fields are missing.
-            2. An appropriate error message is included in the response indicating the missing 'title'.
-        - Ensures the input validation for category creation is implemented correctly.
-        """
-        # Payload missing the title field
-        data = {}
-        
-        # Make a POST request to the `/categories/create/` endpoint
-        response = self.client.post('/categories/create/', data)
-        
-        # Assert that the response status is 400 Bad Request
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Assert that the response contains an error message for the missing 'title'
-        self.assertIn("title", response.data)
+        # A client that already has this list gets an empty 304
+        etag = response['ETag']
+        response = self.client.get('/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Creating a category changes the ETag, so the new list is sent
+        self.client.post('/categories/create/', {'title': 'Second Category'})
+        response = self.client.get('/categories/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
 
     def test_unsuccessful_get_notes_by_invalid_category(self):
         """
@@ -410,8 +373,10 @@ class NoteAppTests(APITestCase):
             2. Proper filtering by user is applied.
         - Ensures users can view all their notes.
         """
-        # Make a GET request to fetch all notes for the user
-        response = self.client.get('/notes/')
+        # Make a GET request to fetch all notes for the user: one query for the
+        # ETag version and one for the rows, regardless of the number of notes
+        with self.assertNumQueries(2):  # Fails if serializing notes starts querying per row
+            response = self.client.get('/notes/')
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -419,6 +384,16 @@ class NoteAppTests(APITestCase):
         # Assert that the number of notes returned matches the expected count
         self.assertEqual(len(response.data), 1)  # One note was created in setUp
 
+        # A client that already has this version gets an empty 304 after the version query
+        with self.assertNumQueries(1):
+            response = self.client.get('/notes/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Changing a note changes the ETag
+        self.client.post(f'/notes/toggle-pin/{self.note.id}/')
+        response = self.client.get('/notes/', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
     def test_get_notes_by_category_success(self):
         """
         - Test Level: Unit-level.
@@ -430,7 +405,8 @@ class NoteAppTests(APITestCase):
         - Ensures the system correctly implements filtering by category and returns relevant data.
         """
         # Make a GET request to the endpoint for retrieving notes by category ID
-        response = self.client.get(f'/notes/category/{self.category.id}/')
+        with self.assertNumQueries(2):  # One category lookup, one notes query
+            response = self.client.get(self.cat_notes_url)
 
         # Assert that the response status is 200 OK, indicating success
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -471,7 +447,7 @@ class NoteAppTests(APITestCase):
         - Ensures users can view individual notes securely.
         """
         # Make a GET request to retrieve the note by its ID
-        response = self.client.get(f'/notes/{self.note.id}/')
+        response = self.client.get(self.note_url)
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -492,7 +468,7 @@ class NoteAppTests(APITestCase):
         data = {"title": "Updated Note"}
         
         # Make a PUT request to update the note by its ID
-        response = self.client.put(f'/notes/update/{self.note.id}/', data)
+        response = self.client.put(self.note_update_url, data)
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -513,7 +489,7 @@ class NoteAppTests(APITestCase):
         - Ensures users can remove notes securely.
         """
         # Make a DELETE request to remove the note by its ID
-        response = self.client.delete(f'/notes/delete/{self.note.id}/')
+        response = self.client.delete(self.note_delete_url)
         
         # Assert that the response status is 200 OK
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -521,6 +497,56 @@ class NoteAppTests(APITestCase):
         # Assert that the note no longer exists in the database
         self.assertFalse(Note.objects.filter(id=self.note.id).exists())
 
+    def test_toggle_pin_success(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate toggling the pinned flag of a note.
+        - Software: Tests the `/notes/toggle-pin/<id>/` endpoint to ensure:
+            1. The flag is flipped in the database and the new value is returned.
+            2. Toggling twice restores the original value.
+        - Ensures users can pin and unpin notes.
+        """
+        url = f'/notes/toggle-pin/{self.note.id}/'
+        for expected in (True, False):
+            response = self.client.post(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertEqual(response.data['pinned'], expected)
+            self.assertEqual(Note.objects.get(id=self.note.id).pinned, expected)
+
+    def test_unsuccessful_toggle_pin_concurrent_change(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that a toggle based on a stale read does not overwrite a concurrent one.
+        - Software: Tests the `/notes/toggle-pin/<id>/` endpoint to ensure:
+            1. A toggle whose read no longer matches the database results in a 409 Conflict status.
+            2. The stored pinned flag is left as the concurrent request set it.
+        """
+        # Another request pinned the note after this one read it as unpinned
+        stale = Note.objects.only('id', 'user_id', 'pinned').get(id=self.note.id)
+        Note.objects.filter(id=self.note.id).update(pinned=True)
+        with patch('myapp.views._get_own_note', return_value=stale):
+            response = self.client.post(f'/notes/toggle-pin/{self.note.id}/')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertTrue(Note.objects.get(id=self.note.id).pinned)
+
+    def test_toggle_pin_changes_etag(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that every pin toggle invalidates the note and note-list ETags.
+        - Software: Tests the `/notes/<id>/`, `/notes/` and `/notes/toggle-pin/<id>/` endpoints to ensure:
+            1. Two toggles in quick succession each produce a new ETag.
+            2. A client holding the previous ETag gets the fresh note instead of a 304.
+        """
+        for url in (f'/notes/{self.note.id}/', '/notes/'):
+            with self.subTest(url=url):
+                etag = self.client.get(url)['ETag']
+                for _ in range(2):
+                    self.client.post(f'/notes/toggle-pin/{self.note.id}/')
+                    response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+                    self.assertEqual(response.status_code, status.HTTP_200_OK)
+                    self.assertNotEqual(response['ETag'], etag)
+                    etag = response['ETag']
+
     def test_unsuccessful_get_note_invalid_id(self):
         """
         - Test Level: Unit-level.
@@ -539,6 +565,25 @@ class NoteAppTests(APITestCase):
         # Assert that the response contains an error message
         self.assertIn("message", response.data)
 
+    def test_unsuccessful_access_other_users_note(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that notes owned by another user cannot be read, updated or deleted.
+        - Software: Tests the `/notes/<id>/`, `/notes/update/<id>/` and `/notes/delete/<id>/` endpoints to ensure:
+            1. Each request results in a 404 Not Found status, exactly as for a missing note.
+            2. The other user's note is left untouched.
+        - Ensures note ids of other users are not disclosed.
+        """
+        other = User.objects.create_user(username="otheruser", email="other@example.com", password="password123")
+        note = Note.objects.create(title="Other Note", content="Private", user=other)
+
+        self.assertEqual(self.client.get(f'/notes/{note.id}/').status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.put(f'/notes/update/{note.id}/', {'title': 'Taken'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        response = self.client.delete(f'/notes/delete/{note.id}/')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(Note.objects.get(id=note.id).title, "Other Note")
+
     def test_unsuccessful_update_note_invalid_id(self):
         """
         - Test Level: Unit-level.
@@ -578,26 +623,46 @@ class NoteAppTests(APITestCase):
         # Assert that the response contains an error message
         self.assertIn("message", response.data)
 
-    def test_unsuccessful_create_note_invalid_category(self):
+    def test_update_note_font_style(self):
         """
         - Test Level: Unit-level.
-        - Purpose: Validate error handling for creating a note with an invalid category ID.
+        - Purpose: Validate that font styles are accepted and returned by name.
+        - Software: Tests the `/notes/update/<id>/` endpoint to ensure:
+            1. A named font style is stored as its numeric code.
+            2. The response reports the font style by name.
+        """
+        response = self.client.put(self.note_update_url, {"font_style": "italic"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["font_style"], "italic")
+        self.note.refresh_from_db()
+        self.assertEqual(self.note.get_font_style_display(), "italic")
+
+    def test_unsuccessful_create_note_invalid_font_style(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate error handling for creating a note with an unknown font style.
         - Software: Tests the `/notes/create/` endpoint to ensure:
-            1. Providing a non-existent category ID results in a 400 Bad Request status.
-            2. The response contains an appropriate error message indicating the invalid category.
-        - Ensures the system validates foreign key references during note creation.
+            1. An unknown font style results in a 400 Bad Request status.
+            2. The response contains an error message.
         """
-        # Payload with a non-existent category ID
-        data = {"title": "Test Note", "content": "This is a test note.", "category": 9999}
-        
-        # Make a POST request to create a note with an invalid category
+        data = {"title": "Test Note", "content": "This is a test note.", "category": self.category.id, "font_style": "wavy"}
+        response = self.client.post('/notes/create/', data)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("error", response.data)
+
+    def test_unsuccessful_create_note_title_too_long(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that note creation enforces the same title length as note updates.
+        - Software: Tests the `/notes/create/` endpoint to ensure:
+            1. A title longer than 120 characters results in a 400 Bad Request status.
+            2. No note is created.
+        """
+        data = {"title": "x" * 300, "content": "This is a test note.", "category": self.category.id}
         response = self.client.post('/notes/create/', data)
-        
-        # Assert that the response status is 400 Bad Request
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        
-        # Assert that the response contains an error message for the invalid category
         self.assertIn("error", response.data)
+        self.assertFalse(Note.objects.filter(title="x" * 300).exists())
    
     # ------------------------- Search Notes Tests -------------------------
 
@@ -652,6 +717,130 @@ class NoteAppTests(APITestCase):
         self.assertIn("error", response.data)  # Check for error message
     
 
+    # ------------------------- Text Assistant Tests -------------------------
+
+    def mock_gemini(self, answer):
+        """Patch the Gemini model so every request returns `answer` as its text."""
+        patcher = patch('myapp.views._gemini_model')
+        model = patcher.start().return_value
+        model.generate_content.return_value.text = answer
+        self.addCleanup(patcher.stop)
+        return model
+
+    def test_check_grammar_boolean_answers(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that JSON-mode booleans are understood by the grammar check.
+        - Software: Tests the `/check_grammar/` endpoint to ensure:
+            1. Boolean answers select the correction branch.
+            2. The corrected text from the model is returned.
+        """
+        self.mock_gemini(json.dumps({"makes_sense": True, "correctable": True, "is_correct": False, "corrected": "I am here"}))
+        response = self.client.post('/check_grammar/', {"text": "i am here"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["correctedText"], "I am here.")
+
+    def test_unsuccessful_check_grammar_bad_model_output(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate error handling when the model answer is unusable.
+        - Software: Tests the `/check_grammar/` endpoint to ensure:
+            1. Unparseable output and a missing correction are reported as errors.
+            2. No empty correction is returned with a 200 status.
+        """
+        cases = [
+            ("not json", status.HTTP_502_BAD_GATEWAY),
+            (json.dumps({"makes_sense": True, "correctable": True, "is_correct": False}), status.HTTP_502_BAD_GATEWAY),
+        ]
+        for answer, expected_status in cases:
+            with self.subTest(answer=answer):
+                self.mock_gemini(answer)
+                response = self.client.post('/check_grammar/', {"text": "i am here"})
+                self.assertEqual(response.status_code, expected_status)
+                self.assertIn("error", response.data)
+
+    def test_check_grammar_retries_after_incomplete_answer(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that an incomplete model answer is not cached.
+        - Software: Tests the `/check_grammar/` endpoint to ensure:
+            1. An answer without a correction results in an error.
+            2. Retrying the same text asks the model again and returns its correction.
+        """
+        model = self.mock_gemini(json.dumps({"makes_sense": True, "correctable": True, "is_correct": False}))
+        response = self.client.post('/check_grammar/', {"text": "i am here"})
+        self.assertEqual(response.status_code, status.HTTP_502_BAD_GATEWAY)
+
+        model.generate_content.return_value.text = json.dumps(
+            {"makes_sense": True, "correctable": True, "is_correct": False, "corrected": "I am here"}
+        )
+        response = self.client.post('/check_grammar/', {"text": "i am here"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["correctedText"], "I am here.")
+        self.assertEqual(model.generate_content.call_count, 2)
+
+    def test_unsuccessful_summarize_nonsense_text(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that text the model rejects with boolean answers is not summarized.
+        - Software: Tests the `/summarize/` endpoint to ensure:
+            1. makes_sense and correctable both false results in a 400 Bad Request status.
+        """
+        self.mock_gemini(json.dumps({"makes_sense": False, "correctable": False, "summary": "Something"}))
+        response = self.client.post('/summarize/', {"text": "qwpoe zxmn"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("message", response.data)
+
+    # ------------------------- Missing Field Tests -------------------------
+
+    def test_unsuccessful_requests_missing_fields(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate error handling for requests with missing required fields.
+        - Software: Tests the `/register/`, `/login/`, `/reset-password/` and `/categories/create/`
+          endpoints to ensure:
+            1. Missing required fields result in a 400 Bad Request status.
+            2. The response names the error, or the missing field, under the expected key.
+        - Ensures input validation is implemented consistently across endpoints.
+        """
+        cases = [
+            # Registration with only the username, missing email and password
+            ('/register/', {"username": "newuser"}, "error"),
+            # Login missing the password field
+            ('/login/', {"username": "testuser"}, "password"),
+            # Password reset missing the new password field
+            ('/reset-password/', {"current_password": "password123"}, "error"),
+            # Category creation missing the title field
+            ('/categories/create/', {}, "title"),
+        ]
+        for endpoint, data, expected_key in cases:
+            with self.subTest(endpoint=endpoint):
+                response = self.client.post(endpoint, data)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn(expected_key, response.data)
+
+    # ------------------------- Serializer Tests -------------------------
+
+    def test_cached_bind_keeps_custom_field_binding(self):
+        """
+        - Test Level: Unit-level.
+        - Purpose: Validate that bind caching does not skip fields with their own `bind()`.
+        - Software: Tests `CachedBindMixin` to ensure:
+            1. A SerializerMethodField works on every instance, not just the first.
+        """
+        class TitleLengthSerializer(CachedBindMixin, serializers.ModelSerializer):
+            title_length = serializers.SerializerMethodField()
+
+            class Meta:
+                model = Note
+                fields = ('id', 'title_length')
+
+            def get_title_length(self, note):
+                return len(note.title)
+
+        for _ in range(2):
+            self.assertEqual(TitleLengthSerializer(self.note).data['title_length'], len(self.note.title))
+
     # ------------------------- Unauthorized Access Tests -------------------------
 
     def test_unauthorized_access_protection(self):
@@ -663,8 +852,8 @@ class NoteAppTests(APITestCase):
             2. The API returns a 401 Unauthorized status with an appropriate error message.
         - Ensures that sensitive data is protected from unauthorized users.
         """
-        # Clear the authorization token to simulate an unauthenticated request
-        self.client.credentials()
+        # Drop the forced authentication to simulate an unauthenticated request
+        self.client.force_authenticate(user=None)
 
         # Make a GET request to the `/notes/` endpoint without a valid token
         response = self.client.get('/notes/')
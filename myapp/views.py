@@ -3,18 +3,125 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
-from .models import Category, Note
+from .models import Category, FontStyle, Note
 from .serializers import CategorySerializer, NoteSerializer
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 from django.contrib.auth.hashers import check_password
 import google.generativeai as genai
+import hashlib
+import json
+import orjson
 import os
+import re
 from datetime import datetime
+from functools import lru_cache
 from django.http import HttpResponse
 from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.utils import timezone
+from django.utils.cache import parse_etags, quote_etag
 
+# Gemini answers for a given prompt are reused for an hour.
+GEMINI_CACHE_TIMEOUT = 60 * 60
+
+# Text starting with "I "/"i " or containing " I " is written in the first person.
+_FIRST_PERSON = re.compile(r'^[Ii] | I ')
+
+
+def _get_own_note(queryset, note_id, user):
+    """
+    Fetch a note by primary key alone and check the owner in Python. Other
+    users' notes are reported as missing so their ids are not disclosed.
+    """
+    try:
+        note = queryset.get(pk=note_id)
+    except Note.DoesNotExist:
+        return None
+    return note if note.user_id == user.id else None
+
+
+def _etag(*parts):
+    return quote_etag(hashlib.md5(':'.join(map(str, parts)).encode()).hexdigest())
+
+
+def _etag_matches(request, etag):
+    """True when the client's If-None-Match already names `etag`."""
+    etags = parse_etags(request.META.get('HTTP_IF_NONE_MATCH', ''))
+    return etag in etags or '*' in etags
+
+
+@lru_cache(maxsize=1)
+def _gemini_model(api_key):
+    """Configure the client and build the model once per API key, not per request."""
+    genai.configure(api_key=api_key)
+    return genai.GenerativeModel("gemini-1.5-flash")
+
+
+def _json_schema(**properties):
+    """Response schema for a JSON object whose keys are all required."""
+    return {
+        'type': 'object',
+        'properties': {name: {'type': kind} for name, kind in properties.items()},
+        'required': list(properties),
+    }
+
+
+_SUMMARY_SCHEMA = _json_schema(makes_sense='boolean', correctable='boolean', summary='string')
+_CHECK_SCHEMA = _json_schema(makes_sense='boolean', correctable='boolean', is_correct='boolean', corrected='string')
+
+
+def _generate_json(model, schema, prompt):
+    """
+    Run a single Gemini request that answers every question as one JSON object
+    shaped by `schema`. Returns None when the answer is not a JSON object.
+    Complete answers are cached by prompt, so retries of the same text are free;
+    incomplete ones are not, so a retry asks Gemini again.
+    """
+    key = 'gemini:' + hashlib.sha256(prompt.encode()).hexdigest()
+    result = cache.get(key)
+    if result is not None:
+        return result
+    response = model.generate_content(
+        prompt, generation_config={'response_mime_type': 'application/json', 'response_schema': schema}
+    )
+    try:
+        result = json.loads(response.text)
+    except ValueError:
+        return None
+    if not isinstance(result, dict):
+        return None
+    if _is_complete(result, schema):
+        cache.set(key, result, GEMINI_CACHE_TIMEOUT)
+    return result
+
+
+def _is_complete(result, schema):
+    """True when every required key holds a usable answer of its schema type."""
+    for name in schema['required']:
+        value = result.get(name)
+        if schema['properties'][name]['type'] == 'boolean':
+            if _yes_no(value) is None:
+                return False
+        elif not isinstance(value, str) or not value.strip():
+            return False
+    return True
+
+
+def _yes_no(answer):
+    """
+    Read a yes/no answer, which may come back as a boolean or as the strings
+    'yes'/'no'. Returns None when the answer is missing or unrecognised.
+    """
+    if isinstance(answer, bool):
+        return answer
+    if isinstance(answer, str):
+        return {'yes': True, 'true': True, 'no': False, 'false': False}.get(answer.strip().lower())
+    return None
 
 
 def index(request):
@@ -33,10 +140,12 @@ def index(request):
 def register(request):
     data = request.data
     try:
-        user = User.objects.create_user(username=data['username'], email=data['email'], password=data['password'],first_name=data['first_name'],  # Add first name
-            last_name=data['last_name'])
-        user.save()
-        refresh = RefreshToken.for_user(user)
+        # create_user() already saves; the token's outstanding-token row is
+        # written in the same transaction.
+        with transaction.atomic():
+            user = User.objects.create_user(username=data['username'], email=data['email'], password=data['password'],first_name=data['first_name'],  # Add first name
+                last_name=data['last_name'])
+            refresh = RefreshToken.for_user(user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
         return Response({
@@ -48,12 +157,6 @@ def register(request):
         return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
 
-@api_view(['POST'])
-def login(request):
-    from rest_framework_simplejwt.views import TokenObtainPairView
-    return TokenObtainPairView.as_view()(request._request)
-
-
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def reset_password(request):
@@ -116,9 +219,7 @@ def create_category(request):
 @permission_classes([IsAuthenticated])
 def edit_category(request, category_id):
     try:
-        print("cat", category_id)
         category = Category.objects.get(id=category_id)
-        print("cat", category)
     except Category.DoesNotExist:
         return Response({"detail": "Category not found."}, status=status.HTTP_404_NOT_FOUND)
     if category.user != request.user:
@@ -132,9 +233,14 @@ def edit_category(request, category_id):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_categories(request):
-    categories = Category.objects.filter(user=request.user)
-    serializer = CategorySerializer(categories, many=True)
-    return Response(serializer.data)
+    categories = CategorySerializer.setup_eager_loading(Category.objects.filter(user=request.user))
+    data = CategorySerializer(categories, many=True).data
+    # The list is small, so its content serves as the version. orjson yields
+    # the same bytes the renderer sends, without the stdlib encoder's cost.
+    etag = _etag('categories', orjson.dumps(data).decode())
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return Response(data, headers={'ETag': etag})
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -143,11 +249,21 @@ def create_note(request):
     content = request.data.get('content')
     category_id = request.data.get('category')
     pinned = request.data.get('pinned', False)
-    font_size = request.data.get('font_size')
-    font_style = request.data.get('font_style')
+    font_size = request.data.get('font_size', Note._meta.get_field('font_size').default)
+    font_style = request.data.get('font_style', FontStyle.NORMAL.label)
 
     if not title or not content or not category_id:
         return Response({'error': 'All fields are required'}, status=status.HTTP_400_BAD_REQUEST)
+    # Check the inputs against the same fields that guard update_note.
+    fields = NoteSerializer().fields
+    try:
+        title = fields['title'].run_validation(title)
+    except ValidationError as exc:
+        return Response({'error': f'Title: {exc.detail[0]}'}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        font_style = fields['font_style'].run_validation(font_style)
+    except ValidationError:
+        return Response({'error': 'Invalid font style'}, status=status.HTTP_400_BAD_REQUEST)
     
     try:
         category = Category.objects.get(id=category_id, user=request.user)
@@ -170,29 +286,44 @@ def create_note(request):
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 def toggle_pin(request, note_id):
-    try:
-        note = Note.objects.get(id=note_id, user=request.user)
-    except Note.DoesNotExist:
+    note = _get_own_note(Note.objects.only('id', 'user_id', 'pinned'), note_id, request.user)
+    if note is None:
         return Response({'error': 'Note not found'}, status=status.HTTP_404_NOT_FOUND)
-    note.pinned = not note.pinned
-    note.save()
+    # djongo cannot translate a CASE expression in an UPDATE, so flip the flag
+    # with a compare-and-set that only matches if nobody toggled it since the
+    # read. `pinned__in` keeps the WHERE as a plain comparison djongo accepts;
+    # update() bypasses auto_now, so updated_at is stamped for the ETags.
+    pinned = not note.pinned
+    updated = Note.objects.filter(pk=note.pk, user=request.user, pinned__in=[note.pinned]).update(
+        pinned=pinned, updated_at=timezone.now()
+    )
+    if not updated:
+        return Response({'error': 'Note was changed by another request, please retry'}, status=status.HTTP_409_CONFLICT)
 
-    return Response({'message': 'Pin status updated', 'pinned': note.pinned}, status=status.HTTP_200_OK)
+    return Response({'message': 'Pin status updated', 'pinned': pinned}, status=status.HTTP_200_OK)
 
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_notes(request):
-    notes = Note.objects.filter(user=request.user).order_by('-pinned')
+    # Count catches deletions; the latest updated_at catches creates and edits.
+    version = Note.objects.filter(user=request.user).aggregate(count=Count('id'), last=Max('updated_at'))
+    etag = _etag('notes', request.user.id, version['count'], version['last'])
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    # Plain rows skip model instantiation; NoteSerializer accepts them as-is.
+    notes = Note.objects.filter(user=request.user).order_by('-pinned').values(*NoteSerializer.Meta.fields)
     serializer = NoteSerializer(notes, many=True)
-    return Response(serializer.data)
+    return Response(serializer.data, headers={'ETag': etag})
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_notes_by_category(request, category_id):
     try:
         category = Category.objects.get(id=category_id, user=request.user)
-        notes = Note.objects.filter(category=category, user=request.user).order_by('-pinned')
+        notes = Note.objects.filter(
+            category=category, user=request.user
+        ).order_by('-pinned').values(*NoteSerializer.Meta.fields)
         serializer = NoteSerializer(notes, many=True)
         return Response(serializer.data, status=status.HTTP_200_OK)
     except Category.DoesNotExist:
@@ -202,36 +333,34 @@ def get_notes_by_category(request, category_id):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_note(request, note_id):
-    try:
-        note = Note.objects.get(id=note_id, user=request.user)
-    except Note.DoesNotExist:
+    note = _get_own_note(NoteSerializer.setup_eager_loading(Note.objects.all()), note_id, request.user)
+    if note is None:
         return Response({'message': 'Note not found'}, status=status.HTTP_404_NOT_FOUND)
+    etag = _etag('note', note.id, note.updated_at)
+    if _etag_matches(request, etag):
+        return Response(status=status.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
     
     serializer = NoteSerializer(note)
-    return Response(serializer.data)
+    return Response(serializer.data, headers={'ETag': etag})
 
 
 @api_view(['PUT'])
 @permission_classes([IsAuthenticated])
 def update_note(request, note_id):
-    print("data", request.data)
-    try:
-        note = Note.objects.get(id=note_id, user=request.user)
-    except Note.DoesNotExist:
+    note = _get_own_note(NoteSerializer.setup_eager_loading(Note.objects.all()), note_id, request.user)
+    if note is None:
         return Response({'message': 'Note not found'}, status=status.HTTP_404_NOT_FOUND)
     serializer = NoteSerializer(note, data=request.data, partial=True)
     if serializer.is_valid():
         serializer.save()
-        print("updated", serializer.data)
         return Response(serializer.data)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 @api_view(['DELETE'])
 @permission_classes([IsAuthenticated])
 def delete_note(request, note_id):
-    try:
-        note = Note.objects.get(id=note_id, user=request.user)
-    except Note.DoesNotExist:
+    note = _get_own_note(Note.objects.only('id', 'user_id'), note_id, request.user)
+    if note is None:
         return Response({'message': 'Note not found'}, status=status.HTTP_404_NOT_FOUND)
 
     note.delete()
@@ -241,16 +370,11 @@ def delete_note(request, note_id):
 
 @permission_classes([IsAuthenticated])
 def delete_category(request, category_id):
-
-    try:
-        category = Category.objects.get(id=category_id, user=request.user)
-
-    except Category.DoesNotExist:
+    # The FK cascade removes the notes with a single DELETE ... WHERE category_id
+    # IN (...); no note rows are loaded since nothing listens to their signals.
+    deleted, _ = Category.objects.filter(id=category_id, user=request.user).delete()
+    if not deleted:
         return Response({'message': 'Category not found'}, status=status.HTTP_404_NOT_FOUND)
-    notes = Note.objects.filter(category=category) 
-
-    notes.delete()
-    category.delete()
     return Response({'message': 'Category and associated notes deleted successfully'}, status=status.HTTP_200_OK)
 
 @api_view(['GET'])
@@ -264,11 +388,9 @@ def search_notes(request):
     query = request.query_params.get('q', None)
     if not query:
         return Response({'error': 'Search query parameter `q` is required'}, status=status.HTTP_400_BAD_REQUEST)
-    notes = Note.objects.filter(user=request.user)
+    notes = NoteSerializer.setup_eager_loading(Note.objects.filter(user=request.user))
     filtered_notes = notes.filter(
-        title__icontains=query
-    ) | notes.filter(
-        category__title__icontains=query
+        Q(title__icontains=query) | Q(category__title__icontains=query)
     )
     serializer = NoteSerializer(filtered_notes, many=True)
     return Response(serializer.data, status=status.HTTP_200_OK)
@@ -276,7 +398,6 @@ def search_notes(request):
 
 @api_view(['POST'])
 def reset_new_password(request):
-    print("data", request.data)
     data = request.data
     username = data.get('username')
     email = data.get('email')
@@ -284,17 +405,8 @@ def reset_new_password(request):
         return Response({'error': 'Username is required'}, status=status.HTTP_400_BAD_REQUEST)
     if not email:
         return Response({'error': 'Email is required'}, status=status.HTTP_400_BAD_REQUEST)
-    try:
-        user = User.objects.get(username=username)
-    except User.DoesNotExist:
-        return Response({'error': 'User with this username does not exist'}, status=status.HTTP_404_NOT_FOUND)
-    try:
-        user = User.objects.get(email=email)
-    except User.DoesNotExist:
-        return Response({'error': 'User with this email does not exist'}, status=status.HTTP_404_NOT_FOUND)
-    try:
-        user = User.objects.get(username=username, email=email)
-    except User.DoesNotExist:
+    user = User.objects.filter(username=username, email=email).first()
+    if user is None:
         return Response({'error': 'Username and email do not match'}, status=status.HTTP_404_NOT_FOUND)
     new_password = data.get('new_password')
     re_type_password = data.get('re_type_password')
@@ -313,31 +425,27 @@ def summarize_text(request):
     original_text = request.data.get('text')
     if not original_text or not isinstance(original_text, str) or len(original_text.strip()) == 0:
         return Response({'error': 'Input text is empty or invalid.'}, status=status.HTTP_400_BAD_REQUEST)
-    genai.configure(api_key=KEY)
-    model = genai.GenerativeModel("gemini-1.5-flash")
-    analysis_response = model.generate_content(
-        f"Does the following text convey meaning, even if it contains grammar or spelling errors? Answer 'yes' or 'no': {original_text}"
-    )
-    if "no" in analysis_response.text.lower():
-        correction_check = model.generate_content(
-            f"Can the following text be corrected to make sense? Answer 'yes' or 'no': {original_text}"
-        )
-        if "no" in correction_check.text.lower():
-            return Response(
-                {'message': 'The provided text cannot be summarized meaningfully. Please provide coherent text.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-    if " I " in original_text or original_text.lower().startswith("i "):
-        summary_prompt = (
-            f"Act as a professional summarizer. Retain the first-person perspective while condensing: {original_text}"
-        )
+    model = _gemini_model(KEY)
+    if _FIRST_PERSON.search(original_text):
+        summary_instruction = "Retain the first-person perspective while condensing the text."
     else:
-        summary_prompt = (
-            f"Act as a professional summarizer. Condense the following text while retaining its essence and correcting grammar and spelling: {original_text}"
+        summary_instruction = "Condense the text while retaining its essence and correcting grammar and spelling."
+    result = _generate_json(model, _SUMMARY_SCHEMA, (
+        "Act as a professional summarizer. Return a JSON object with these keys: "
+        "makes_sense (boolean: does the text convey meaning, even if it contains grammar or spelling errors?), "
+        "correctable (boolean: can the text be corrected to make sense?), "
+        f"summary (string: {summary_instruction}). "
+        f"Text: {original_text}"
+    ))
+    if result is None:
+        return Response({'error': 'The text could not be analysed. Please try again.'}, status=status.HTTP_502_BAD_GATEWAY)
+    if _yes_no(result.get('makes_sense')) is False and _yes_no(result.get('correctable')) is False:
+        return Response(
+            {'message': 'The provided text cannot be summarized meaningfully. Please provide coherent text.'},
+            status=status.HTTP_400_BAD_REQUEST
         )
-
-    response = model.generate_content(summary_prompt)
-    summary = response.text.strip()
+    summary = result.get('summary')
+    summary = summary.strip() if isinstance(summary, str) else ''
     if not summary or summary.lower() == original_text.lower() or len(summary) < 3:
         return Response(
             {'message': 'The summarization failed to produce meaningful output. Please provide valid and coherent text.'},
@@ -353,24 +461,31 @@ def check_text(request):
     original_text = request.data.get('text') 
     if not original_text or not isinstance(original_text, str) or len(original_text.strip()) == 0:
         return Response({'error': 'Input text is empty or invalid.'}, status=status.HTTP_400_BAD_REQUEST)
-    genai.configure(api_key=KEY)
-    model = genai.GenerativeModel("gemini-1.5-flash")
-    sense_check_response = model.generate_content(f"Does this text make sense? Answer 'yes' or 'no': {original_text}")
-    if "no" in sense_check_response.text.lower():
-        grammar_check_response = model.generate_content(f"Can this text be corrected to make sense? Answer 'yes' or 'no': {original_text}")
-        if "no" in grammar_check_response.text.lower():
-            return Response(
-                {'message': 'The provided text is nonsensical or invalid. Please provide meaningful input.'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-    correctness_response = model.generate_content(f"Is this text grammatically and punctually correct? Answer 'yes' or 'no': {original_text}")
-    if "yes" in correctness_response.text.lower():
+    model = _gemini_model(KEY)
+    result = _generate_json(model, _CHECK_SCHEMA, (
+        "Return a JSON object with these keys: "
+        "makes_sense (boolean: does this text make sense?), "
+        "correctable (boolean: can this text be corrected to make sense?), "
+        "is_correct (boolean: is this text grammatically and punctually correct?), "
+        "corrected (string: the text with grammar, punctuation, and spelling corrected). "
+        f"Text: {original_text}"
+    ))
+    if result is None:
+        return Response({'error': 'The text could not be analysed. Please try again.'}, status=status.HTTP_502_BAD_GATEWAY)
+    if _yes_no(result.get('makes_sense')) is False and _yes_no(result.get('correctable')) is False:
+        return Response(
+            {'message': 'The provided text is nonsensical or invalid. Please provide meaningful input.'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if _yes_no(result.get('is_correct')):
         return Response(
             {'message': 'No fix required!'},
             status=status.HTTP_200_OK
         )
-    correction_response = model.generate_content(f"Correct grammar, punctuation, and spelling: {original_text}")
-    corrected_text = correction_response.text.strip()
+    corrected_text = result.get('corrected')
+    corrected_text = corrected_text.strip() if isinstance(corrected_text, str) else ''
+    if not corrected_text:
+        return Response({'error': 'The text could not be corrected. Please try again.'}, status=status.HTTP_502_BAD_GATEWAY)
     if not corrected_text.endswith("."):
         corrected_text += "."
 
@@ -379,6 +494,7 @@ def check_text(request):
         status=status.HTTP_200_OK
     )
 
+
 @api_view(['GET'])
 def get_firstname(request):
     if request.user.is_authenticated:
@@ -88,7 +88,8 @@ DATABASES = {
         'CLIENT': {
             'host': os.getenv('DATABASE_URL'),
             'ssl': True,  
-        }
+        },
+        'CONN_MAX_AGE': 60,
     }
 }
 
@@ -162,6 +163,10 @@ REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    'DEFAULT_RENDERER_CLASSES': (
+        'myapp.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
 }
 
 from datetime import timedelta
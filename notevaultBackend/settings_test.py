@@ -0,0 +1,32 @@
+"""
+Django settings for running the notevaultBackend test suite.
+
+Extends the project settings with overrides that only make sense for tests.
+"""
+from .settings import *  # noqa: F401,F403
+
+
+class DisableMigrations:
+    """Create the test schema straight from the models instead of replaying migrations."""
+
+    def __contains__(self, item):
+        return True
+
+    def __getitem__(self, item):
+        return None
+
+
+MIGRATION_MODULES = DisableMigrations()
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# Hashing speed is irrelevant in tests; the default PBKDF2 hasher is deliberately slow.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Persistent connections don't apply to the in-memory test database.
+SILENCED_SYSTEM_CHECKS = ['myapp.W001']
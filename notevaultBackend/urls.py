@@ -1,23 +1,25 @@
 from django.urls import path
 from myapp import views
-from rest_framework_simplejwt.views import TokenRefreshView
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 from django.conf import settings
 from django.conf.urls.static import static
 
 
 urlpatterns = [
+    # Routes are tried in order; the note list and detail views are the most
+    # requested, so they come first.
+    path('notes/', views.get_notes, name='get_notes'),              
+    path('notes/<int:note_id>/', views.get_note, name='get_note'),   
     path('', views.index),
     path('register/', views.register, name='register'),
-    path('login/', views.login, name='login'),
+    path('login/', TokenObtainPairView.as_view(), name='login'),
     path('profile/', views.profile, name='profile'),
     path('reset-password/', views.reset_password, name='reset-password'),
     path('refresh/', TokenRefreshView.as_view(), name='token_refresh'),
     path('categories/', views.get_categories, name='get_categories'),
     path('categories/create/', views.create_category, name='create_category'),
-    path('notes/', views.get_notes, name='get_notes'),              
     path('notes/create/', views.create_note, name='create_note'),    
     path('notes/category/<int:category_id>/', views.get_notes_by_category, name='notes_by_category'), 
-    path('notes/<int:note_id>/', views.get_note, name='get_note'),   
     path('notes/update/<int:note_id>/', views.update_note, name='update_note'),  
     path('notes/delete/<int:note_id>/', views.delete_note, name='delete_note'),  
     path('notes/search/', views.search_notes, name='search_notes'), 